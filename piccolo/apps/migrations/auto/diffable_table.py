@@ -177,9 +177,9 @@ class DiffableTable:
 
     def __hash__(self) -> int:
         """
-        We have to return an integer, which is why convert the string this way.
+        Hashes the same fields which are compared in ``__eq__``.
         """
-        return hash(self.class_name + self.tablename)
+        return hash((self.class_name, self.tablename))
 
     def __eq__(self, value) -> bool:
         """
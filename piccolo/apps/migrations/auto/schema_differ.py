@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import datetime
+import decimal
 import typing as t
-from copy import deepcopy
-from dataclasses import dataclass, field
+import uuid
+from dataclasses import dataclass, field, replace
+from enum import Enum
 
 from piccolo.apps.migrations.auto.diffable_table import (
     DiffableTable,
@@ -10,43 +13,172 @@ from piccolo.apps.migrations.auto.diffable_table import (
 )
 from piccolo.apps.migrations.auto.operations import RenameColumn, RenameTable
 from piccolo.apps.migrations.auto.serialisation import Import, serialise_params
+from piccolo.columns.defaults.base import Default
 from piccolo.utils.printing import get_fixed_length_string
 
+# Param values which compare the same way before and after serialisation, so
+# can be compared without serialising them first.
+FINGERPRINT_TYPES = (
+    str,
+    int,
+    float,
+    type(None),
+    decimal.Decimal,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    uuid.UUID,
+    Enum,
+    Default,
+)
+
+
+def _get_value_fingerprint(value: t.Any) -> t.Any:
+    """
+    Returns something hashable which only compares equal to values which
+    would be serialised the same, or raises a ``ValueError`` if we can't be
+    sure.
+    """
+    if isinstance(value, tuple):
+        return tuple(_get_value_fingerprint(i) for i in value)
+    if isinstance(value, FINGERPRINT_TYPES):
+        # The type is included, as some values compare equal to values of a
+        # different type (e.g. a str Enum member and a str).
+        return (type(value), value)
+    raise ValueError("Unable to fingerprint the value.")
+
+
+def _params_unchanged(
+    params: t.Dict[str, t.Any], snapshot_params: t.Dict[str, t.Any]
+) -> bool:
+    """
+    Like ``compare_dicts``, only the keys in ``params`` are checked - the
+    snapshot can contain extra keys (e.g. legacy ones like ``primary`` from
+    older migration files), which are ignored by the diff.
+    """
+    for key, value in params.items():
+        snapshot_value = snapshot_params.get(key, ...)
+        if snapshot_value is ...:
+            return False
+
+        try:
+            if _get_value_fingerprint(value) == _get_value_fingerprint(
+                snapshot_value
+            ):
+                continue
+        except ValueError:
+            pass
+
+        # Values such as foreign key references and ``Array`` base columns
+        # have to be serialised before they can be compared.
+        serialised = serialise_params({key: value})
+        snapshot_serialised = serialise_params({key: snapshot_value})
+        if serialised.params != snapshot_serialised.params:
+            return False
+
+    return True
+
+
+def is_schema_unchanged(
+    schema: t.List[DiffableTable], schema_snapshot: t.List[DiffableTable]
+) -> bool:
+    """
+    Cheaply tells if the schema matches the snapshot, in which case there's
+    no need to diff them. It errs on the side of returning ``False``.
+    """
+    if len(schema) != len(schema_snapshot):
+        return False
+
+    snapshot_map = {(i.class_name, i.tablename): i for i in schema_snapshot}
+
+    for table in schema:
+        snapshot_table = snapshot_map.get((table.class_name, table.tablename))
+        if snapshot_table is None:
+            return False
+
+        if len(table.columns) != len(snapshot_table.columns):
+            return False
+
+        # Don't use ``columns_map``, as ``SchemaSnapshot`` modifies the
+        # columns after the ``DiffableTable`` is created.
+        snapshot_columns = {i._meta.name: i for i in snapshot_table.columns}
+
+        for column in table.columns:
+            snapshot_column = snapshot_columns.get(column._meta.name)
+            if snapshot_column is None:
+                return False
+
+            column_db_name = column._meta.db_column_name
+            if snapshot_column._meta.db_column_name != column_db_name:
+                return False
+
+            if snapshot_column.__class__ is not column.__class__:
+                return False
+
+            if not _params_unchanged(
+                column._meta.params, snapshot_column._meta.params
+            ):
+                return False
+
+    return True
+
 
 @dataclass
 class RenameTableCollection:
     rename_tables: t.List[RenameTable] = field(default_factory=list)
 
+    def __post_init__(self):
+        # These are mostly used for membership checks, so we keep them as
+        # sets, and update them as renames are appended.
+        self._old_class_names: t.Set[str] = set()
+        self._new_class_names: t.Set[str] = set()
+        # Maps the new class name to the old class name.
+        self._renamed_from: t.Dict[str, str] = {}
+        for renamed_table in self.rename_tables:
+            self._index(renamed_table)
+
+    def _index(self, renamed_table: RenameTable):
+        self._old_class_names.add(renamed_table.old_class_name)
+        self._new_class_names.add(renamed_table.new_class_name)
+        self._renamed_from.setdefault(
+            renamed_table.new_class_name, renamed_table.old_class_name
+        )
+
     def append(self, renamed_table: RenameTable):
         self.rename_tables.append(renamed_table)
+        self._index(renamed_table)
 
     @property
-    def old_class_names(self):
-        return [i.old_class_name for i in self.rename_tables]
+    def old_class_names(self) -> t.Set[str]:
+        return self._old_class_names
 
     @property
-    def new_class_names(self):
-        return [i.new_class_name for i in self.rename_tables]
+    def new_class_names(self) -> t.Set[str]:
+        return self._new_class_names
 
     def renamed_from(self, new_class_name: str) -> t.Optional[str]:
         """
         Returns the old class name, if it exists.
         """
-        rename = [
-            i for i in self.rename_tables if i.new_class_name == new_class_name
-        ]
-        if len(rename) > 0:
-            return rename[0].old_class_name
-        else:
-            return None
+        return self._renamed_from.get(new_class_name)
 
 
 @dataclass
 class RenameColumnCollection:
     rename_columns: t.List[RenameColumn] = field(default_factory=list)
 
+    def __post_init__(self):
+        self._old_column_names: t.Set[str] = {
+            i.old_column_name for i in self.rename_columns
+        }
+        self._new_column_names: t.Set[str] = {
+            i.new_column_name for i in self.rename_columns
+        }
+
     def append(self, rename_column: RenameColumn):
         self.rename_columns.append(rename_column)
+        self._old_column_names.add(rename_column.old_column_name)
+        self._new_column_names.add(rename_column.new_column_name)
 
     def for_table_class_name(
         self, table_class_name: str
@@ -58,12 +190,12 @@ class RenameColumnCollection:
         ]
 
     @property
-    def old_column_names(self):
-        return [i.old_column_name for i in self.rename_columns]
+    def old_column_names(self) -> t.Set[str]:
+        return self._old_column_names
 
     @property
-    def new_column_names(self):
-        return [i.new_column_name for i in self.rename_columns]
+    def new_column_names(self) -> t.Set[str]:
+        return self._new_column_names
 
 
 @dataclass
@@ -96,20 +228,57 @@ class SchemaDiffer:
         self.schema_snapshot_map: t.Dict[str, DiffableTable] = {
             i.class_name: i for i in self.schema_snapshot
         }
-        self.rename_tables_collection = self.check_rename_tables()
-        self.rename_columns_collection = self.check_renamed_columns()
+        # Diffing two tables isn't cheap, and several of the properties below
+        # need the same results, so we cache them.
+        self._delta_cache: t.Dict[str, TableDelta] = {}
+        self._column_statements: t.Optional[
+            t.Dict[str, AlterStatements]
+        ] = None
+        # The same column classes are used by lots of columns.
+        self._class_imports: t.Dict[t.Type, Import] = {}
+
+        # Tables which are in the schema but not the snapshot, and vice versa.
+        # Several of the properties below need these, so only work them out
+        # once. The tablename is included, as changing it without changing
+        # the class name counts as a rename.
+        schema_keys = {(i.class_name, i.tablename) for i in self.schema}
+        schema_snapshot_keys = {
+            (i.class_name, i.tablename) for i in self.schema_snapshot
+        }
+        self._new_tables: t.List[DiffableTable] = [
+            i
+            for i in self.schema
+            if (i.class_name, i.tablename) not in schema_snapshot_keys
+        ]
+        self._dropped_tables: t.List[DiffableTable] = [
+            i
+            for i in self.schema_snapshot
+            if (i.class_name, i.tablename) not in schema_keys
+        ]
+
+        # If nothing has changed, which is common, we can skip the diffing.
+        self._unchanged = is_schema_unchanged(
+            schema=self.schema, schema_snapshot=self.schema_snapshot
+        )
+
+        if self._unchanged:
+            self.rename_tables_collection = RenameTableCollection()
+            # There's no need to diff any of the tables.
+            self._matched_tables: t.List[
+                t.Tuple[DiffableTable, DiffableTable]
+            ] = []
+            self.rename_columns_collection = RenameColumnCollection()
+        else:
+            self.rename_tables_collection = self.check_rename_tables()
+            self._matched_tables = self._get_matched_tables()
+            self.rename_columns_collection = self.check_renamed_columns()
 
     def check_rename_tables(self) -> RenameTableCollection:
         """
         Work out whether any of the tables were renamed.
         """
-        drop_tables: t.List[DiffableTable] = list(
-            set(self.schema_snapshot) - set(self.schema)
-        )
-
-        new_tables: t.List[DiffableTable] = list(
-            set(self.schema) - set(self.schema_snapshot)
-        )
+        drop_tables = self._dropped_tables
+        new_tables = self._new_tables
 
         # A mapping of the old table name (i.e. dropped table) to the new
         # table name.
@@ -120,56 +289,63 @@ class SchemaDiffer:
             # table for a rename to make sense.
             return collection
 
-        # A renamed table should have at least one column remaining with the
-        # same name.
+        # The column names of each dropped table - computed once up front,
+        # rather than for every combination of new and dropped table.
+        drop_column_names: t.Dict[str, t.FrozenSet[str]] = {
+            i.class_name: frozenset(
+                column._meta.db_column_name for column in i.columns
+            )
+            for i in drop_tables
+        }
+
         for new_table in new_tables:
-            new_column_names = [
+            new_column_names = frozenset(
                 i._meta.db_column_name for i in new_table.columns
-            ]
+            )
             for drop_table in drop_tables:
-                drop_column_names = [
-                    i._meta.db_column_name for i in new_table.columns
-                ]
-                same_column_names = set(new_column_names).intersection(
-                    drop_column_names
-                )
-                if len(same_column_names) > 0:
-                    if (
-                        drop_table.class_name == new_table.class_name
-                        and drop_table.tablename != new_table.tablename
-                    ):
-                        # The class names are the same, but the tablename
-                        # has changed - we can assume this is a deliberate
-                        # rename.
-                        collection.append(
-                            RenameTable(
-                                old_class_name=drop_table.class_name,
-                                old_tablename=drop_table.tablename,
-                                new_class_name=new_table.class_name,
-                                new_tablename=new_table.tablename,
-                            )
+                if (
+                    drop_table.class_name == new_table.class_name
+                    and drop_table.tablename != new_table.tablename
+                ):
+                    # The class names are the same, but the tablename has
+                    # changed - we can assume this is a deliberate rename,
+                    # even if the columns have changed too.
+                    collection.append(
+                        RenameTable(
+                            old_class_name=drop_table.class_name,
+                            old_tablename=drop_table.tablename,
+                            new_class_name=new_table.class_name,
+                            new_tablename=new_table.tablename,
                         )
-                        continue
+                    )
+                    continue
 
-                    user_response = (
-                        self.auto_input
-                        if self.auto_input
-                        else input(
-                            f"Did you rename {drop_table.class_name} "
-                            f"(tablename: {drop_table.tablename}) to "
-                            f"{new_table.class_name} "
-                            f"(tablename: {new_table.tablename})? (y/N)"
-                        )
+                # Otherwise, a renamed table should have at least one column
+                # remaining with the same name.
+                if new_column_names.isdisjoint(
+                    drop_column_names[drop_table.class_name]
+                ):
+                    continue
+
+                user_response = (
+                    self.auto_input
+                    if self.auto_input
+                    else input(
+                        f"Did you rename {drop_table.class_name} "
+                        f"(tablename: {drop_table.tablename}) to "
+                        f"{new_table.class_name} "
+                        f"(tablename: {new_table.tablename})? (y/N)"
                     )
-                    if user_response.lower() == "y":
-                        collection.append(
-                            RenameTable(
-                                old_class_name=drop_table.class_name,
-                                old_tablename=drop_table.tablename,
-                                new_class_name=new_table.class_name,
-                                new_tablename=new_table.tablename,
-                            )
+                )
+                if user_response.lower() == "y":
+                    collection.append(
+                        RenameTable(
+                            old_class_name=drop_table.class_name,
+                            old_tablename=drop_table.tablename,
+                            new_class_name=new_table.class_name,
+                            new_tablename=new_table.tablename,
                         )
+                    )
 
         return collection
 
@@ -179,13 +355,11 @@ class SchemaDiffer:
         """
         collection = RenameColumnCollection()
 
-        for table in self.schema:
-            snapshot_table = self.schema_snapshot_map.get(
-                table.class_name, None
-            )
-            if not snapshot_table:
+        for table, snapshot_table in self._matched_tables:
+            if table.class_name not in self.schema_snapshot_map:
+                # Renamed tables are ignored.
                 continue
-            delta: TableDelta = table - snapshot_table
+            delta = self._get_delta(table, snapshot_table)
 
             if (not delta.add_columns) and (not delta.drop_columns):
                 continue
@@ -232,14 +406,10 @@ class SchemaDiffer:
 
     @property
     def create_tables(self) -> AlterStatements:
-        new_tables: t.List[DiffableTable] = list(
-            set(self.schema) - set(self.schema_snapshot)
-        )
-
         # Remove any which are renames
         new_tables = [
             i
-            for i in new_tables
+            for i in self._new_tables
             if i.class_name
             not in self.rename_tables_collection.new_class_names
         ]
@@ -253,14 +423,10 @@ class SchemaDiffer:
 
     @property
     def drop_tables(self) -> AlterStatements:
-        drop_tables: t.List[DiffableTable] = list(
-            set(self.schema_snapshot) - set(self.schema)
-        )
-
         # Remove any which are renames
         drop_tables = [
             i
-            for i in drop_tables
+            for i in self._dropped_tables
             if i.class_name
             not in self.rename_tables_collection.old_class_names
         ]
@@ -290,39 +456,80 @@ class SchemaDiffer:
         if snapshot_table:
             return snapshot_table
         else:
-            if (
+            class_name = self.rename_tables_collection.renamed_from(
                 table_class_name
-                in self.rename_tables_collection.new_class_names
-            ):
-                class_name = self.rename_tables_collection.renamed_from(
-                    table_class_name
-                )
+            )
+            if class_name is not None:
                 snapshot_table = self.schema_snapshot_map.get(class_name)
                 if snapshot_table:
-                    snapshot_table.class_name = table_class_name
-                    return snapshot_table
+                    # Return a copy, rather than modifying the snapshot
+                    # table, as the original class name is still needed to
+                    # identify which tables were dropped.
+                    return replace(snapshot_table, class_name=table_class_name)
         return None
 
-    @property
-    def alter_columns(self) -> AlterStatements:
-        response: t.List[str] = []
-        extra_imports: t.List[Import] = []
-        extra_definitions: t.List[str] = []
+    def _get_matched_tables(
+        self,
+    ) -> t.List[t.Tuple[DiffableTable, DiffableTable]]:
+        """
+        Returns each table in the schema which is also in the snapshot (even
+        if it was renamed), along with the snapshot table.
+        """
+        matched_tables = []
         for table in self.schema:
             snapshot_table = self._get_snapshot_table(table.class_name)
-            if snapshot_table:
-                delta: TableDelta = table - snapshot_table
-            else:
-                continue
+            if snapshot_table is not None:
+                matched_tables.append((table, snapshot_table))
+        return matched_tables
+
+    def _get_delta(
+        self, table: DiffableTable, snapshot_table: DiffableTable
+    ) -> TableDelta:
+        """
+        Returns the changes between the table and its snapshot.
+        """
+        delta = self._delta_cache.get(table.class_name)
+        if delta is None:
+            delta = table - snapshot_table
+            self._delta_cache[table.class_name] = delta
+        return delta
+
+    def _get_column_statements(self) -> t.Dict[str, AlterStatements]:
+        """
+        Works out the alter, drop, and add column statements for the tables
+        which already exist, in a single pass over the schema.
+        """
+        if self._column_statements is not None:
+            return self._column_statements
+
+        alter_statements: t.List[str] = []
+        alter_imports: t.List[Import] = []
+        alter_definitions: t.List[str] = []
+
+        drop_statements: t.List[str] = []
+
+        add_statements: t.List[str] = []
+        add_imports: t.List[Import] = []
+        add_definitions: t.List[str] = []
+
+        for table, snapshot_table in self._matched_tables:
+            delta = self._get_delta(table, snapshot_table)
+
+            # The start of each statement is the same for every column in the
+            # table, so only build it once.
+            table_kwargs = (
+                f"table_class_name='{table.class_name}', "
+                f"tablename='{table.tablename}'"
+            )
 
             for alter_column in delta.alter_columns:
                 new_params = serialise_params(alter_column.params)
-                extra_imports.extend(new_params.extra_imports)
-                extra_definitions.extend(new_params.extra_definitions)
+                alter_imports.extend(new_params.extra_imports)
+                alter_definitions.extend(new_params.extra_definitions)
 
                 old_params = serialise_params(alter_column.old_params)
-                extra_imports.extend(old_params.extra_imports)
-                extra_definitions.extend(old_params.extra_definitions)
+                alter_imports.extend(old_params.extra_imports)
+                alter_definitions.extend(old_params.extra_definitions)
 
                 column_class = (
                     alter_column.column_class.__name__
@@ -337,41 +544,19 @@ class SchemaDiffer:
                 )
 
                 if alter_column.column_class is not None:
-                    extra_imports.append(
-                        Import(
-                            module=alter_column.column_class.__module__,
-                            target=alter_column.column_class.__name__,
-                        )
+                    alter_imports.append(
+                        self._get_class_import(alter_column.column_class)
                     )
 
                 if alter_column.old_column_class is not None:
-                    extra_imports.append(
-                        Import(
-                            module=alter_column.old_column_class.__module__,
-                            target=alter_column.old_column_class.__name__,
-                        )
+                    alter_imports.append(
+                        self._get_class_import(alter_column.old_column_class)
                     )
 
-                response.append(
-                    f"manager.alter_column(table_class_name='{table.class_name}', tablename='{table.tablename}', column_name='{alter_column.column_name}', params={new_params.params}, old_params={old_params.params}, column_class={column_class}, old_column_class={old_column_class})"  # noqa: E501
+                alter_statements.append(
+                    f"manager.alter_column({table_kwargs}, column_name='{alter_column.column_name}', params={new_params.params}, old_params={old_params.params}, column_class={column_class}, old_column_class={old_column_class})"  # noqa: E501
                 )
 
-        return AlterStatements(
-            statements=response,
-            extra_imports=extra_imports,
-            extra_definitions=extra_definitions,
-        )
-
-    @property
-    def drop_columns(self) -> AlterStatements:
-        response = []
-        for table in self.schema:
-            snapshot_table = self._get_snapshot_table(table.class_name)
-            if snapshot_table:
-                delta: TableDelta = table - snapshot_table
-            else:
-                continue
-
             for column in delta.drop_columns:
                 if (
                     column.column_name
@@ -379,22 +564,9 @@ class SchemaDiffer:
                 ):
                     continue
 
-                response.append(
-                    f"manager.drop_column(table_class_name='{table.class_name}', tablename='{table.tablename}', column_name='{column.column_name}', db_column_name='{column.db_column_name}')"  # noqa: E501
+                drop_statements.append(
+                    f"manager.drop_column({table_kwargs}, column_name='{column.column_name}', db_column_name='{column.db_column_name}')"  # noqa: E501
                 )
-        return AlterStatements(statements=response)
-
-    @property
-    def add_columns(self) -> AlterStatements:
-        response: t.List[str] = []
-        extra_imports: t.List[Import] = []
-        extra_definitions: t.List[str] = []
-        for table in self.schema:
-            snapshot_table = self._get_snapshot_table(table.class_name)
-            if snapshot_table:
-                delta: TableDelta = table - snapshot_table
-            else:
-                continue
 
             for add_column in delta.add_columns:
                 if (
@@ -405,25 +577,52 @@ class SchemaDiffer:
 
                 params = serialise_params(add_column.params)
                 cleaned_params = params.params
-                extra_imports.extend(params.extra_imports)
-                extra_definitions.extend(params.extra_definitions)
-
-                column_class = add_column.column_class
-                extra_imports.append(
-                    Import(
-                        module=column_class.__module__,
-                        target=column_class.__name__,
-                    )
+                add_imports.extend(params.extra_imports)
+                add_definitions.extend(params.extra_definitions)
+                add_imports.append(
+                    self._get_class_import(add_column.column_class)
                 )
 
-                response.append(
-                    f"manager.add_column(table_class_name='{table.class_name}', tablename='{table.tablename}', column_name='{add_column.column_name}', db_column_name='{add_column.db_column_name}', column_class_name='{add_column.column_class_name}', column_class={column_class.__name__}, params={str(cleaned_params)})"  # noqa: E501
+                add_statements.append(
+                    f"manager.add_column({table_kwargs}, column_name='{add_column.column_name}', db_column_name='{add_column.db_column_name}', column_class_name='{add_column.column_class_name}', column_class={add_column.column_class.__name__}, params={str(cleaned_params)})"  # noqa: E501
                 )
-        return AlterStatements(
-            statements=response,
-            extra_imports=extra_imports,
-            extra_definitions=extra_definitions,
-        )
+
+        self._column_statements = {
+            "alter_columns": AlterStatements(
+                statements=alter_statements,
+                extra_imports=alter_imports,
+                extra_definitions=alter_definitions,
+            ),
+            "drop_columns": AlterStatements(statements=drop_statements),
+            "add_columns": AlterStatements(
+                statements=add_statements,
+                extra_imports=add_imports,
+                extra_definitions=add_definitions,
+            ),
+        }
+        return self._column_statements
+
+    def _get_class_import(self, class_: t.Type) -> Import:
+        """
+        Returns the ``Import`` required for the given class.
+        """
+        _import = self._class_imports.get(class_)
+        if _import is None:
+            _import = Import(module=class_.__module__, target=class_.__name__)
+            self._class_imports[class_] = _import
+        return _import
+
+    @property
+    def alter_columns(self) -> AlterStatements:
+        return self._get_column_statements()["alter_columns"]
+
+    @property
+    def drop_columns(self) -> AlterStatements:
+        return self._get_column_statements()["drop_columns"]
+
+    @property
+    def add_columns(self) -> AlterStatements:
+        return self._get_column_statements()["add_columns"]
 
     @property
     def rename_columns(self) -> AlterStatements:
@@ -438,37 +637,33 @@ class SchemaDiffer:
 
     @property
     def new_table_columns(self) -> AlterStatements:
-        new_tables: t.List[DiffableTable] = list(
-            set(self.schema) - set(self.schema_snapshot)
-        )
-
         response: t.List[str] = []
         extra_imports: t.List[Import] = []
         extra_definitions: t.List[str] = []
-        for table in new_tables:
+        for table in self._new_tables:
             if (
                 table.class_name
                 in self.rename_tables_collection.new_class_names
             ):
                 continue
 
+            table_kwargs = (
+                f"table_class_name='{table.class_name}', "
+                f"tablename='{table.tablename}'"
+            )
+
             for column in table.columns:
-                # In case we cause subtle bugs:
-                params = deepcopy(column._meta.params)
-                _params = serialise_params(params)
+                # serialise_params copies the params before modifying them,
+                # so we don't need to.
+                _params = serialise_params(column._meta.params)
                 cleaned_params = _params.params
                 extra_imports.extend(_params.extra_imports)
                 extra_definitions.extend(_params.extra_definitions)
 
-                extra_imports.append(
-                    Import(
-                        module=column.__class__.__module__,
-                        target=column.__class__.__name__,
-                    )
-                )
+                extra_imports.append(self._get_class_import(column.__class__))
 
                 response.append(
-                    f"manager.add_column(table_class_name='{table.class_name}', tablename='{table.tablename}', column_name='{column._meta.name}', db_column_name='{column._meta.db_column_name}', column_class_name='{column.__class__.__name__}', column_class={column.__class__.__name__}, params={str(cleaned_params)})"  # noqa: E501
+                    f"manager.add_column({table_kwargs}, column_name='{column._meta.name}', db_column_name='{column._meta.db_column_name}', column_class_name='{column.__class__.__name__}', column_class={column.__class__.__name__}, params={str(cleaned_params)})"  # noqa: E501
                 )
         return AlterStatements(
             statements=response,
@@ -493,9 +688,14 @@ class SchemaDiffer:
             "Altered columns": self.alter_columns,
         }
 
-        for message, statements in alter_statements.items():
-            _message = get_fixed_length_string(message, length=40)
-            count = len(statements.statements)
-            print(f"{_message} {count}")
+        # Print the summary in one go, so it isn't interleaved with other
+        # output.
+        print(
+            "\n".join(
+                f"{get_fixed_length_string(message, length=40)} "
+                f"{len(statements.statements)}"
+                for message, statements in alter_statements.items()
+            )
+        )
 
         return [i for i in alter_statements.values()]
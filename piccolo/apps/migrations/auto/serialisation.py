@@ -96,7 +96,7 @@ class SerialisedTableType:
 
     def __hash__(self):
         return hash(
-            f"{self.table_type._meta.tablename}-{self.table_type.__name__}"
+            (self.table_type._meta.tablename, self.table_type.__name__)
         )
 
     def __eq__(self, other):
@@ -180,10 +180,12 @@ class Import:
         return f"from {self.module} import {self.target}"
 
     def __hash__(self):
-        return hash(f"{self.module}-{self.target}")
+        return hash((self.module, self.target))
 
     def __lt__(self, other):
-        return repr(self) < repr(other)
+        # Equivalent to comparing the import statements, without having to
+        # build them.
+        return (self.module, self.target) < (other.module, other.target)
 
 
 @dataclass
@@ -34,6 +34,9 @@ JINJA_ENV = jinja2.Environment(
 
 MIGRATION_MODULES: t.Dict[str, ModuleType] = {}
 
+# The timestamp of the most recently generated migration ID.
+_last_migration_timestamp: t.Optional[datetime.datetime] = None
+
 
 def render_template(**kwargs):
     template = JINJA_ENV.get_template("migration.py.jinja")
@@ -64,11 +67,27 @@ def _generate_migration_meta(app_config: AppConfig) -> NewMigrationMeta:
     """
     Generates the migration ID and filename.
     """
+    global _last_migration_timestamp
+
     # The microseconds originally weren't part of the ID, but there was a
     # chance that the IDs would clash if the migrations are generated
     # programatically in quick succession (e.g. in a unit test), so they had
     # to be added. The trade off is a longer ID.
-    _id = datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%S:%f")
+    timestamp = datetime.datetime.now()
+
+    # The clock's resolution can be coarser than a microsecond, so make sure
+    # each ID is greater than the previous one, rather than relying on time
+    # having passed.
+    if (
+        _last_migration_timestamp is not None
+        and timestamp <= _last_migration_timestamp
+    ):
+        timestamp = _last_migration_timestamp + datetime.timedelta(
+            microseconds=1
+        )
+    _last_migration_timestamp = timestamp
+
+    _id = timestamp.strftime("%Y-%m-%dT%H:%M:%S:%f")
 
     # Originally we just used the _id as the filename, but colons aren't
     # supported in Windows, so we need to sanitize it. We don't want to
@@ -106,12 +125,24 @@ async def _create_new_migration(
         _alter_statements = list(
             chain(*[i.statements for i in alter_statements])
         )
+        # Render each import and definition to a string once, rather than
+        # repeatedly when sorting them. Rendering a definition requires its
+        # primary key params to be serialised, which isn't cheap.
         extra_imports = sorted(
-            list(set(chain(*[i.extra_imports for i in alter_statements]))),
-            key=lambda x: x.__repr__(),
+            set(
+                repr(i)
+                for i in set(
+                    chain(*[i.extra_imports for i in alter_statements])
+                )
+            )
         )
         extra_definitions = sorted(
-            list(set(chain(*[i.extra_definitions for i in alter_statements]))),
+            set(
+                repr(i)
+                for i in set(
+                    chain(*[i.extra_definitions for i in alter_statements])
+                )
+            )
         )
 
         if sum(len(i.statements) for i in alter_statements) == 0:
@@ -162,7 +162,7 @@ def run(
     else:
         db = SQLiteEngine()
     for _table in TABLES:
-        _table._meta._db = db
+        _table._meta.db = db
     print("Tables:\n")
 
     for _table in TABLES:
@@ -13,6 +13,12 @@ def change_password():
     Change a user's password.
     """
     username = get_username()
+
+    # Check the user exists before asking for the new password, and before
+    # it's hashed, which is deliberately slow.
+    if not BaseUser.exists().where(BaseUser.username == username).run_sync():
+        sys.exit(f"User {username} doesn't exist!")
+
     password = get_password()
     confirmed_password = get_confirmed_password()
 
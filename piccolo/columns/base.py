@@ -178,11 +178,7 @@ class ColumnMeta:
 
     @property
     def engine_type(self) -> str:
-        engine = self.table._meta.db
-        if engine:
-            return engine.engine_type
-        else:
-            raise ValueError("The table has no engine defined.")
+        return self.table._meta.engine_type
 
     def get_choices_dict(self) -> t.Optional[t.Dict[str, t.Any]]:
         """
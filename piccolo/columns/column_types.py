@@ -181,7 +181,7 @@ class Varchar(Column):
             return "VARCHAR"
 
     def __add__(self, value: t.Union[str, Varchar, Text]) -> QueryString:
-        engine_type = self._meta.table._meta.db.engine_type
+        engine_type = self._meta.engine_type
         return self.concat_delegate.get_querystring(
             column_name=self._meta.db_column_name,
             value=value,
@@ -189,7 +189,7 @@ class Varchar(Column):
         )
 
     def __radd__(self, value: t.Union[str, Varchar, Text]) -> QueryString:
-        engine_type = self._meta.table._meta.db.engine_type
+        engine_type = self._meta.engine_type
         return self.concat_delegate.get_querystring(
             column_name=self._meta.db_column_name,
             value=value,
@@ -261,7 +261,7 @@ class Text(Column):
         super().__init__(**kwargs)
 
     def __add__(self, value: t.Union[str, Varchar, Text]) -> QueryString:
-        engine_type = self._meta.table._meta.db.engine_type
+        engine_type = self._meta.engine_type
         return self.concat_delegate.get_querystring(
             column_name=self._meta.db_column_name,
             value=value,
@@ -269,7 +269,7 @@ class Text(Column):
         )
 
     def __radd__(self, value: t.Union[str, Varchar, Text]) -> QueryString:
-        engine_type = self._meta.table._meta.db.engine_type
+        engine_type = self._meta.engine_type
         return self.concat_delegate.get_querystring(
             column_name=self._meta.db_column_name,
             value=value,
@@ -455,7 +455,7 @@ class BigInt(Integer):
 
     @property
     def column_type(self):
-        engine_type = self._meta.table._meta.db.engine_type
+        engine_type = self._meta.engine_type
         if engine_type == "postgres":
             return "BIGINT"
         elif engine_type == "sqlite":
@@ -486,7 +486,7 @@ class SmallInt(Integer):
 
     @property
     def column_type(self):
-        engine_type = self._meta.table._meta.db.engine_type
+        engine_type = self._meta.engine_type
         if engine_type == "postgres":
             return "SMALLINT"
         elif engine_type == "sqlite":
@@ -508,7 +508,7 @@ class Serial(Column):
 
     @property
     def column_type(self):
-        engine_type = self._meta.table._meta.db.engine_type
+        engine_type = self._meta.engine_type
         if engine_type == "postgres":
             return "SERIAL"
         elif engine_type == "sqlite":
@@ -516,7 +516,7 @@ class Serial(Column):
         raise Exception("Unrecognized engine type")
 
     def default(self):
-        engine_type = self._meta.table._meta.db.engine_type
+        engine_type = self._meta.engine_type
         if engine_type == "postgres":
             return DEFAULT
         elif engine_type == "sqlite":
@@ -531,7 +531,7 @@ class BigSerial(Serial):
 
     @property
     def column_type(self):
-        engine_type = self._meta.table._meta.db.engine_type
+        engine_type = self._meta.engine_type
         if engine_type == "postgres":
             return "BIGSERIAL"
         elif engine_type == "sqlite":
@@ -776,7 +776,7 @@ class Interval(Column):  # lgtm [py/missing-equals]
 
     @property
     def column_type(self):
-        engine_type = self._meta.table._meta.db.engine_type
+        engine_type = self._meta.engine_type
         if engine_type == "postgres":
             return "INTERVAL"
         elif engine_type == "sqlite":
@@ -1538,7 +1538,7 @@ class Bytea(Column):
 
     @property
     def column_type(self):
-        engine_type = self._meta.table._meta.db.engine_type
+        engine_type = self._meta.engine_type
         if engine_type == "postgres":
             return "BYTEA"
         elif engine_type == "sqlite":
@@ -1623,7 +1623,7 @@ class Array(Column):
 
     @property
     def column_type(self):
-        engine_type = self._meta.table._meta.db.engine_type
+        engine_type = self._meta.engine_type
         if engine_type == "postgres":
             return f"{self.base_column.column_type}[]"
         elif engine_type == "sqlite":
@@ -1649,7 +1649,7 @@ class Array(Column):
 
 
         """
-        engine_type = self._meta.table._meta.db.engine_type
+        engine_type = self._meta.engine_type
         if engine_type != "postgres":
             raise ValueError(
                 "Only Postgres supports array indexing currently."
@@ -1685,7 +1685,7 @@ class Array(Column):
             >>> Ticket.select().where(Ticket.seat_numbers.any(510)).run_sync()
 
         """
-        engine_type = self._meta.table._meta.db.engine_type
+        engine_type = self._meta.engine_type
 
         if engine_type == "postgres":
             return Where(column=self, value=value, operator=ArrayAny)
@@ -1703,7 +1703,7 @@ class Array(Column):
             >>> Ticket.select().where(Ticket.seat_numbers.all(510)).run_sync()
 
         """
-        engine_type = self._meta.table._meta.db.engine_type
+        engine_type = self._meta.engine_type
 
         if engine_type == "postgres":
             return Where(column=self, value=value, operator=ArrayAll)
@@ -330,8 +330,22 @@ class Transaction:
 ###############################################################################
 
 
+# The column names for the most recently seen cursor description. The same
+# description object is used for every row returned by a query, so we only
+# need to extract the column names from it once.
+_column_names_cache: t.Tuple[t.Any, t.Tuple[str, ...]] = (None, ())
+
+
 def dict_factory(cursor, row) -> t.Dict:
-    return {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
+    global _column_names_cache
+
+    description, column_names = _column_names_cache
+    if cursor.description is not description:
+        description = cursor.description
+        column_names = tuple(col[0] for col in description)
+        _column_names_cache = (description, column_names)
+
+    return dict(zip(column_names, row))
 
 
 class SQLiteEngine(Engine):
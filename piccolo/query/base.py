@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-import itertools
+import asyncio
+import functools
 import typing as t
 from time import time
 
@@ -15,6 +16,22 @@ if t.TYPE_CHECKING:  # pragma: no cover
     from piccolo.query.mixins import OutputDelegate
     from piccolo.table import Table  # noqa
 
+# If a query returns at least this many rows, they're converted in a thread.
+EXECUTOR_ROW_THRESHOLD = 1000
+
+
+@functools.lru_cache(maxsize=256)
+def _translate_keys(keys: t.Tuple[str, ...]) -> t.Optional[t.Tuple[str, ...]]:
+    """
+    Columns from joined tables are returned with ``$`` in their names, which
+    are replaced with ``.``. Returns ``None`` if no keys need changing.
+
+    The same queries tend to be run repeatedly, so the result is cached.
+    """
+    if not any("$" in i for i in keys):
+        return None
+    return tuple(i.replace("$", ".") for i in keys)
+
 
 class Timer:
     def __enter__(self):
@@ -29,6 +46,14 @@ class Query:
 
     __slots__ = ("table", "_frozen_querystrings")
 
+    # Whether the subclass defines a ``run_callback`` method, which is called
+    # with the results. It's set automatically for each subclass.
+    _has_run_callback: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._has_run_callback = hasattr(cls, "run_callback")
+
     def __init__(
         self,
         table: t.Type[Table],
@@ -39,27 +64,84 @@ class Query:
 
     @property
     def engine_type(self) -> str:
-        engine = self.table._meta.db
-        if engine:
-            return engine.engine_type
-        else:
-            raise ValueError("Engine isn't defined.")
+        return self.table._meta.engine_type
 
-    async def _process_results(self, results):  # noqa: C901
-        if results:
-            keys = results[0].keys()
-            keys = [i.replace("$", ".") for i in keys]
-            raw = [dict(zip(keys, i.values())) for i in results]
-        else:
-            raw = []
+    @staticmethod
+    def _convert_rows(results) -> t.List[t.Dict[str, t.Any]]:
+        """
+        Converts the rows returned by the database driver into dicts.
+        """
+        if not results:
+            return []
+
+        first_row = results[0]
+        row_keys = tuple(first_row.keys())
+        keys = _translate_keys(row_keys)
+        if keys is None:
+            if isinstance(first_row, dict):
+                # The rows are already dicts with the correct keys (e.g. when
+                # using SQLite), so there's no need to rebuild them.
+                return list(results)
+            keys = row_keys
+
+        return [dict(zip(keys, i.values())) for i in results]
+
+    @staticmethod
+    def _rows_need_converting(results) -> bool:
+        """
+        Whether ``_convert_rows`` has to rebuild the rows. They don't need
+        rebuilding if they're already dicts (e.g. when using SQLite), unless
+        the keys need translating.
+        """
+        first_row = results[0]
+        return (
+            not isinstance(first_row, dict)
+            or _translate_keys(tuple(first_row.keys())) is not None
+        )
 
-        if hasattr(self, "run_callback"):
-            self.run_callback(raw)
+    def _is_values_output(self, output: OutputDelegate) -> bool:
+        """
+        Whether the output is just a list of values, in which case the rows
+        can be used directly, without converting them into dicts first.
+        """
+        limit_delegate = getattr(self, "limit_delegate", None)
+        return (
+            output._output.as_list
+            and not output._output.load_json
+            and not output._output.nested
+            and not (limit_delegate is not None and limit_delegate._first)
+            and not self._has_run_callback
+        )
 
+    async def _process_results(self, results):  # noqa: C901
         output: t.Optional[OutputDelegate] = getattr(
             self, "output_delegate", None
         )
 
+        if results and output is not None and self._is_values_output(output):
+            keys = tuple(results[0].keys())
+            if len(keys) != 1:
+                raise ValueError("Each row returned more than one value")
+            (key,) = keys
+            raw = await self.response_handler([row[key] for row in results])
+            if output._output.as_json:
+                raw = dump_json(raw)
+            return raw
+
+        # Converting a large number of rows can take a while, so do it in a
+        # thread to avoid blocking the event loop - but only if there's
+        # actually some converting to do.
+        is_large = len(results) >= EXECUTOR_ROW_THRESHOLD
+        if is_large and self._rows_need_converting(results):
+            raw = await asyncio.get_running_loop().run_in_executor(
+                None, self._convert_rows, results
+            )
+        else:
+            raw = self._convert_rows(results)
+
+        if self._has_run_callback:
+            self.run_callback(raw)
+
         #######################################################################
 
         if output and output._output.load_json:
@@ -115,30 +197,27 @@ class Query:
                             make_nested_object(row, self.table) for row in raw
                         ]
                     else:
-                        raw = [
-                            self.table(**columns, exists_in_db=True)
-                            for columns in raw
-                        ]
+                        raw = self.table._from_rows(raw)
                 elif raw is None:
                     pass
                 else:
                     if output._output.nested:
                         raw = make_nested_object(raw, self.table)
                     else:
-                        raw = self.table(**raw, exists_in_db=True)
+                        raw = self.table._from_rows([raw])[0]
             elif type(raw) is list:
                 if output._output.as_list:
                     if len(raw) == 0:
                         return []
                     else:
-                        if len(raw[0].keys()) != 1:
+                        keys = raw[0].keys()
+                        if len(keys) != 1:
                             raise ValueError(
                                 "Each row returned more than one value"
                             )
                         else:
-                            raw = list(
-                                itertools.chain(*[j.values() for j in raw])
-                            )
+                            (key,) = keys
+                            raw = [j[key] for j in raw]
                 if output._output.as_json:
                     raw = dump_json(raw)
 
@@ -169,15 +248,17 @@ class Query:
                 "_meta"
             )
 
-        if len(self.querystrings) == 1:
+        querystrings = self.querystrings
+
+        if len(querystrings) == 1:
             results = await engine.run_querystring(
-                self.querystrings[0], in_pool=in_pool
+                querystrings[0], in_pool=in_pool
             )
             return await self._process_results(results)
         else:
             responses = []
             # TODO - run in a transaction
-            for querystring in self.querystrings:
+            for querystring in querystrings:
                 results = await engine.run_querystring(
                     querystring, in_pool=in_pool
                 )
@@ -281,12 +362,13 @@ class Query:
 
         """
         querystrings = self.querystrings
+        engine_type = self.engine_type
         for querystring in querystrings:
-            querystring.freeze(engine_type=self.engine_type)
+            querystring.freeze(engine_type=engine_type)
 
         # Copy the query, so we don't store any references to the original.
         query = self.__class__(
-            table=self.table, frozen_querystrings=self.querystrings
+            table=self.table, frozen_querystrings=querystrings
         )
 
         if hasattr(self, "limit_delegate"):
@@ -337,11 +419,7 @@ class DDL:
 
     @property
     def engine_type(self) -> str:
-        engine = self.table._meta.db
-        if engine:
-            return engine.engine_type
-        else:
-            raise ValueError("Engine isn't defined.")
+        return self.table._meta.engine_type
 
     @property
     def sqlite_ddl(self) -> t.Sequence[str]:
@@ -391,13 +469,15 @@ class DDL:
                 "_meta"
             )
 
-        if len(self.ddl) == 1:
-            return await engine.run_ddl(self.ddl[0], in_pool=in_pool)
+        ddl = self.ddl
+
+        if len(ddl) == 1:
+            return await engine.run_ddl(ddl[0], in_pool=in_pool)
         else:
             responses = []
             # TODO - run in a transaction
-            for ddl in self.ddl:
-                response = await engine.run_ddl(ddl, in_pool=in_pool)
+            for statement in ddl:
+                response = await engine.run_ddl(statement, in_pool=in_pool)
                 responses.append(response)
             return responses
 
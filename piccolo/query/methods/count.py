@@ -24,7 +24,12 @@ class Count(Query):
         self.where_delegate.where(*where)
         return self
 
-    async def response_handler(self, response) -> bool:
+    async def _process_results(self, results) -> int:
+        # There's only a single row, containing the count, so the generic
+        # processing of the rows isn't required.
+        return await self.response_handler(results)
+
+    async def response_handler(self, response) -> int:
         return response[0]["count"]
 
     @property
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import decimal
 import typing as t
-from collections import OrderedDict
 
 from piccolo.columns import Column, Selectable
 from piccolo.columns.readable import Readable
@@ -263,7 +262,8 @@ class Select(Query):
         A call chain is a sequence of foreign keys representing joins which
         need to be made to retrieve a column in another table.
         """
-        joins: t.List[str] = []
+        # A dict is used to remove duplicates, while preserving the order.
+        joins: t.Dict[str, None] = {}
 
         readables: t.List[Readable] = [
             i for i in columns if isinstance(i, Readable)
@@ -277,36 +277,34 @@ class Select(Query):
             if not isinstance(column, Column):
                 continue
 
-            _joins: t.List[str] = []
-            for index, key in enumerate(column._meta.call_chain, 0):
-                table_alias = "$".join(
-                    f"{_key._meta.table._meta.tablename}${_key._meta.name}"
-                    for _key in column._meta.call_chain[: index + 1]
-                )
-
-                key._meta.table_alias = table_alias
+            table_alias: t.Optional[str] = None
+            for key in column._meta.call_chain:
+                tablename = key._meta.table._meta.tablename
+                alias_part = f"{tablename}${key._meta.name}"
 
-                if index > 0:
-                    left_tablename = column._meta.call_chain[
-                        index - 1
-                    ]._meta.table_alias
+                # The alias is built up incrementally, rather than being
+                # regenerated from the start of the call chain for each key.
+                if table_alias is None:
+                    left_tablename = tablename
+                    table_alias = alias_part
                 else:
-                    left_tablename = key._meta.table._meta.tablename
+                    left_tablename = table_alias
+                    table_alias = f"{table_alias}${alias_part}"
+
+                key._meta.table_alias = table_alias
 
                 right_tablename = (
                     key._foreign_key_meta.resolved_references._meta.tablename
                 )
 
-                _joins.append(
+                join = (
                     f"LEFT JOIN {right_tablename} {table_alias}"
                     " ON "
                     f"({left_tablename}.{key._meta.name} = {table_alias}.id)"
                 )
+                joins[join] = None
 
-            joins.extend(_joins)
-
-        # Remove duplicates
-        return list(OrderedDict.fromkeys(joins))
+        return list(joins)
 
     def _check_valid_call_chain(self, keys: t.Sequence[Selectable]) -> bool:
         for column in keys:
@@ -334,7 +332,7 @@ class Select(Query):
 
         # Combine all joins, and remove duplicates
         joins: t.List[str] = list(
-            OrderedDict.fromkeys(select_joins + where_joins + order_by_joins)
+            dict.fromkeys(select_joins + where_joins + order_by_joins)
         )
 
         #######################################################################
@@ -348,7 +346,7 @@ class Select(Query):
         if self.exclude_secrets:
             self.columns_delegate.remove_secret_columns()
 
-        engine_type = self.table._meta.db.engine_type
+        engine_type = self.table._meta.engine_type
 
         select_strings: t.List[str] = [
             c.get_select_string(engine_type=engine_type)
@@ -361,25 +359,30 @@ class Select(Query):
         select = (
             "SELECT DISTINCT" if self.distinct_delegate._distinct else "SELECT"
         )
-        query = f"{select} {columns_str} FROM {self.table._meta.tablename}"
-
-        for join in joins:
-            query += f" {join}"
+        # The query is built up as a list, and joined at the end, rather than
+        # repeatedly concatenating strings.
+        query_parts = [
+            select,
+            columns_str,
+            "FROM",
+            self.table._meta.tablename,
+            *joins,
+        ]
 
         #######################################################################
 
         args: t.List[t.Any] = []
 
         if self.where_delegate._where:
-            query += " WHERE {}"
+            query_parts.append("WHERE {}")
             args.append(self.where_delegate._where.querystring)
 
         if self.group_by_delegate._group_by:
-            query += " {}"
+            query_parts.append("{}")
             args.append(self.group_by_delegate._group_by.querystring)
 
         if self.order_by_delegate._order_by:
-            query += " {}"
+            query_parts.append("{}")
             args.append(self.order_by_delegate._order_by.querystring)
 
         if (
@@ -393,13 +396,13 @@ class Select(Query):
             )
 
         if self.limit_delegate._limit:
-            query += " {}"
+            query_parts.append("{}")
             args.append(self.limit_delegate._limit.querystring)
 
         if self.offset_delegate._offset:
-            query += " {}"
+            query_parts.append("{}")
             args.append(self.offset_delegate._offset.querystring)
 
-        querystring = QueryString(query, *args)
+        querystring = QueryString(" ".join(query_parts), *args)
 
         return [querystring]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import typing as t
 from dataclasses import dataclass
 from string import Formatter
@@ -34,6 +35,15 @@ class Fragment:
     no_arg: bool = False
 
 
+@functools.lru_cache(maxsize=1024)
+def _get_prefixes(template: str) -> t.Tuple[str, ...]:
+    """
+    Split up the template, separating by {}. The same templates are used
+    repeatedly, so the result is cached.
+    """
+    return tuple(i[0] for i in Formatter().parse(template))
+
+
 class QueryString:
     """
     When we're composing complex queries, we're combining QueryStrings, rather
@@ -106,10 +116,7 @@ class QueryString:
         bundled: t.Optional[t.List[Fragment]] = None,
         combined_args: t.Optional[t.List] = None,
     ):
-        # Split up the string, separating by {}.
-        fragments = [
-            Fragment(prefix=i[0]) for i in Formatter().parse(self.template)
-        ]
+        fragments = [Fragment(prefix=i) for i in _get_prefixes(self.template)]
 
         bundled = [] if bundled is None else bundled
         combined_args = [] if combined_args is None else combined_args
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import inspect
 import itertools
+import sys
 import types
 import typing as t
 from dataclasses import dataclass, field
@@ -69,6 +70,7 @@ class TableMeta:
     tags: t.List[str] = field(default_factory=list)
     help_text: t.Optional[str] = None
     _db: t.Optional[Engine] = None
+    _engine_type: t.Optional[str] = None
 
     # Records reverse foreign key relationships - i.e. when the current table
     # is the target of a foreign key. Used by external libraries such as
@@ -101,6 +103,17 @@ class TableMeta:
     @db.setter
     def db(self, value: Engine):
         self._db = value
+        self._engine_type = None
+
+    @property
+    def engine_type(self) -> str:
+        """
+        The type of the engine, e.g. ``'postgres'``. It's cached, as it's
+        needed every time a query is generated.
+        """
+        if self._engine_type is None:
+            self._engine_type = self.db.engine_type
+        return self._engine_type
 
     def refresh_db(self):
         self.db = engine_finder()
@@ -166,7 +179,9 @@ class Table(metaclass=TableMetaclass):
             Admin for tooltips.
 
         """
-        tablename = tablename or _camel_to_snake(cls.__name__)
+        # The tablename is used extensively when generating queries, so intern
+        # it to make comparisons and dict lookups using it faster.
+        tablename = sys.intern(tablename or _camel_to_snake(cls.__name__))
 
         if tablename in PROTECTED_TABLENAMES:
             raise ValueError(
@@ -334,6 +349,44 @@ class Table(metaclass=TableMetaclass):
             unrecognised_list = [i for i in unrecognized]
             raise ValueError(f"Unrecognized columns - {unrecognised_list}")
 
+    @classmethod
+    def _from_rows(cls, rows: t.List[t.Dict[str, t.Any]]) -> t.List[Table]:
+        """
+        Creates instances from rows returned by the database. It's equivalent
+        to ``cls(**row, exists_in_db=True)`` for each row, but when every
+        column is in the rows we can skip the work ``__init__`` does to fill in
+        missing values.
+        """
+        if not rows:
+            return []
+
+        column_names = {
+            i._meta.db_column_name: i._meta.name for i in cls._meta.columns
+        }
+        row_keys = rows[0].keys()
+
+        if (
+            cls.__init__ is not Table.__init__
+            or cls.__setattr__ is not Table.__setattr__
+            or cls.__setitem__ is not Table.__setitem__
+            or row_keys != column_names.keys()
+        ):
+            # A subclass may rely on its own __init__, __setattr__ or
+            # __setitem__ (which __init__ uses to set the values) being
+            # called, so don't bypass them.
+            return [cls(**row, exists_in_db=True) for row in rows]
+
+        attribute_names = tuple(column_names[i] for i in row_keys)
+
+        instances = []
+        for row in rows:
+            instance = cls.__new__(cls)
+            instance._exists_in_db = True
+            instance.__dict__.update(zip(attribute_names, row.values()))
+            instances.append(instance)
+
+        return instances
+
     @classmethod
     def _create_serial_primary_key(cls) -> Serial:
         pk = Serial(index=False, primary_key=True, db_column_name="id")
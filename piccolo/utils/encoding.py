@@ -12,23 +12,29 @@ except ImportError:
     ORJSON = False
 
 
-def dump_json(data: t.Any, pretty: bool = False) -> str:
-    if ORJSON:
-        orjson_params: t.Dict[str, t.Any] = {"default": str}
+# Which library to use is decided once, when the module is imported, rather
+# than every time a value is encoded or decoded.
+if ORJSON:
+    ORJSON_PRETTY_OPTION = (
+        orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE  # type: ignore
+    )
+
+    def dump_json(data: t.Any, pretty: bool = False) -> str:
         if pretty:
-            orjson_params["option"] = (
-                orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE  # type: ignore
-            )
-        return orjson.dumps(data, **orjson_params).decode("utf8")
-    else:
-        params: t.Dict[str, t.Any] = {"default": str}
-        if pretty:
-            params["indent"] = 2
-        return json.dumps(data, **params)
-
+            return orjson.dumps(
+                data, default=str, option=ORJSON_PRETTY_OPTION
+            ).decode("utf8")
+        return orjson.dumps(data, default=str).decode("utf8")
 
-def load_json(data: str) -> t.Any:
-    if ORJSON:
+    def load_json(data: str) -> t.Any:
         return orjson.loads(data)
-    else:
+
+else:
+
+    def dump_json(data: t.Any, pretty: bool = False) -> str:
+        if pretty:
+            return json.dumps(data, default=str, indent=2)
+        return json.dumps(data, default=str)
+
+    def load_json(data: str) -> t.Any:
         return json.loads(data)
@@ -4,5 +4,4 @@ def get_fixed_length_string(string: str, length=20) -> str:
     """
     if len(string) > length:
         return string[: length - 3] + "..."
-    spacing = "".join(" " for i in range(length - len(string)))
-    return f"{string}{spacing}"
+    return string.ljust(length)
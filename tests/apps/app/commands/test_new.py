@@ -1,5 +1,4 @@
 import os
-import shutil
 import tempfile
 from unittest import TestCase
 
@@ -14,17 +13,12 @@ class TestModuleExists(TestCase):
 
 class TestNewApp(TestCase):
     def test_new(self):
-        root = tempfile.gettempdir()
         app_name = "my_app"
 
-        app_path = os.path.join(root, app_name)
-
-        if os.path.exists(app_path):
-            shutil.rmtree(app_path)
-
-        new(app_name=app_name, root=root)
+        with tempfile.TemporaryDirectory() as root:
+            new(app_name=app_name, root=root)
 
-        self.assertTrue(os.path.exists(app_path))
+            self.assertTrue(os.path.exists(os.path.join(root, app_name)))
 
     def test_new_with_clashing_name(self):
         """
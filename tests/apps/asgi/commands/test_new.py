@@ -1,5 +1,4 @@
 import os
-import shutil
 import tempfile
 from unittest import TestCase
 from unittest.mock import patch
@@ -17,12 +16,7 @@ class TestNewApp(TestCase):
         return_value=SERVERS[0],
     )
     def test_new(self, *args, **kwargs):
-        root = os.path.join(tempfile.gettempdir(), "asgi_app")
+        with tempfile.TemporaryDirectory() as root:
+            new(root=root)
 
-        if os.path.exists(root):
-            shutil.rmtree(root)
-
-        os.mkdir(root)
-        new(root=root)
-
-        self.assertTrue(os.path.exists(os.path.join(root, "app.py")))
+            self.assertTrue(os.path.exists(os.path.join(root, "app.py")))
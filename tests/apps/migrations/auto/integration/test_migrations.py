@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
+import decimal
+import enum
 import os
-import shutil
 import tempfile
-import time
+import types
 import typing as t
 import uuid
 from unittest.mock import MagicMock, patch
@@ -40,8 +42,8 @@ from piccolo.columns.column_types import (
 )
 from piccolo.columns.defaults.uuid import UUID4
 from piccolo.conf.apps import AppConfig
+from piccolo.query.methods.create import Create
 from piccolo.table import Table, create_table_class
-from piccolo.utils.sync import run_sync
 from tests.base import DBTestCase, postgres_only
 
 if t.TYPE_CHECKING:
@@ -57,19 +59,19 @@ def integer_default():
 
 
 def uuid_default():
-    return uuid.uuid4()
+    return uuid.UUID("00000000-0000-0000-0000-000000000000")
 
 
 def datetime_default():
-    return datetime.datetime.now()
+    return datetime.datetime(year=2024, month=1, day=1)
 
 
 def time_default():
-    return datetime.datetime.now().time()
+    return datetime.time(hour=0, minute=0)
 
 
 def date_default():
-    return datetime.datetime.now().date()
+    return datetime.date(year=2024, month=1, day=1)
 
 
 def timedelta_default():
@@ -88,21 +90,142 @@ def array_default_varchar():
     return ["x", "y", "z"]
 
 
+def check_column(
+    data_type: str, column_default: t.Union[str, t.Tuple[str, ...]]
+) -> t.Callable[[RowMeta], bool]:
+    """
+    Returns a ``test_function`` for ``_test_migrations``, which checks that
+    the column in the database is non-nullable, with the given type and
+    default. Pass a tuple for ``column_default`` if several values are
+    acceptable (they vary between Postgres versions).
+    """
+    column_defaults = (
+        column_default
+        if isinstance(column_default, tuple)
+        else (column_default,)
+    )
+
+    def test_function(row_meta: RowMeta) -> bool:
+        return (
+            row_meta.data_type == data_type
+            and row_meta.is_nullable == "NO"
+            and row_meta.column_default in column_defaults
+        )
+
+    return test_function
+
+
+CACHEABLE_TYPES = (
+    str,
+    int,
+    float,
+    decimal.Decimal,
+    type(None),
+    enum.Enum,
+    types.FunctionType,
+)
+
+
+def _get_cache_key(column: Column) -> t.Optional[t.Tuple]:
+    """
+    Returns a key which identifies the column, or ``None`` if it can't be
+    cached. Only simple values are supported - for example, comparing columns
+    returns a ``Where`` clause rather than a ``bool``.
+    """
+    values = []
+    for name, value in column._meta.params.items():
+        items = value if type(value) is tuple else (value,)
+        if not all(isinstance(i, CACHEABLE_TYPES) for i in items):
+            return None
+        values.append((name, type(value), value))
+    return (column.__class__, tuple(values))
+
+
+CREATE_DEFAULT_DDL = t.cast(
+    t.Callable[[Create], t.Sequence[str]], Create.__dict__["default_ddl"].fget
+)
+
+
+def unlogged_default_ddl(create: Create) -> t.Sequence[str]:
+    """
+    Only used in these tests - the tables only exist for a short time, so
+    they're created as ``UNLOGGED``, to avoid the overhead of writing them to
+    the write ahead log.
+    """
+    create_table_ddl, *create_indexes = CREATE_DEFAULT_DDL(create)
+    return [
+        create_table_ddl.replace("CREATE TABLE", "CREATE UNLOGGED TABLE", 1),
+        *create_indexes,
+    ]
+
+
 @postgres_only
 class TestMigrations(DBTestCase):
+    loop: asyncio.AbstractEventLoop
+    temp_directory: tempfile.TemporaryDirectory
+    table_cache: t.Dict[t.Tuple, t.Type[Table]]
+    create_patcher: t.Any
+    drop_table_ddl: str
+    truncate_migration_ddl: str
+
+    @classmethod
+    def setUpClass(cls):
+        cls.table_cache = {}
+
+        # `run_sync` creates a new event loop each time it's called during
+        # the tests, so share a single loop between all of the queries here.
+        cls.loop = asyncio.new_event_loop()
+
+        # The table names are the same for every test, so only build the
+        # queries once.
+        tablename = create_table_class("MyTable")._meta.tablename
+        cls.drop_table_ddl = f"DROP TABLE IF EXISTS {tablename}"
+        cls.truncate_migration_ddl = (
+            f"TRUNCATE TABLE {Migration._meta.tablename} RESTART IDENTITY"
+        )
+
+        # The migration table is kept for all of the tests, and emptied after
+        # each one, which is much cheaper than recreating it.
+        cls.run_in_loop(Migration.create_table(if_not_exists=True).run())
+
+        # Each test writes its migrations to a separate sub folder, so we
+        # don't need to delete them between tests. Use a RAM backed directory
+        # when available, as lots of migration files are written.
+        cls.temp_directory = tempfile.TemporaryDirectory(
+            dir="/dev/shm" if os.path.isdir("/dev/shm") else None
+        )
+
+        # This is started last - if anything above fails, `tearDownClass`
+        # isn't called, and the patch would leak into the other tests.
+        cls.create_patcher = patch.object(
+            Create, "default_ddl", property(unlogged_default_ddl)
+        )
+        cls.create_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.run_in_loop(Migration.alter().drop_table(if_exists=True).run())
+        cls.loop.close()
+        cls.temp_directory.cleanup()
+        cls.table_cache.clear()
+        cls.create_patcher.stop()
+
+    @classmethod
+    def run_in_loop(cls, coroutine: t.Coroutine):
+        return cls.loop.run_until_complete(coroutine)
+
     def setUp(self):
         pass
 
     def tearDown(self):
-        create_table_class("MyTable").alter().drop_table(
-            if_exists=True
-        ).run_sync()
-        Migration.alter().drop_table(if_exists=True).run_sync()
+        self.run_in_loop(Migration.raw(self.drop_table_ddl).run())
+        self.run_in_loop(Migration.raw(self.truncate_migration_ddl).run())
 
     def run_migrations(self, app_config: AppConfig):
+        # The migration table is created in `setUpClass`, so we can go
+        # straight to running the migrations.
         manager = ForwardsMigrationManager(app_name=app_config.app_name)
-        run_sync(manager.create_migration_table())
-        run_sync(manager.run_migrations(app_config=app_config))
+        self.run_in_loop(manager.run_migrations(app_config=app_config))
 
     def _test_migrations(
         self,
@@ -110,7 +233,7 @@ class TestMigrations(DBTestCase):
         test_function: t.Optional[t.Callable[[RowMeta], None]] = None,
     ):
         """
-        Writes a migration file to disk and runs it.
+        Writes the migration files to disk and runs them.
 
         :param table_classes:
             Migrations will be created and run based on successive table
@@ -122,14 +245,9 @@ class TestMigrations(DBTestCase):
             test passes, otherwise ``False``.
 
         """
-        temp_directory_path = tempfile.gettempdir()
         migrations_folder_path = os.path.join(
-            temp_directory_path, "piccolo_migrations"
+            self.temp_directory.name, f"piccolo_migrations_{uuid.uuid4().hex}"
         )
-
-        if os.path.exists(migrations_folder_path):
-            shutil.rmtree(migrations_folder_path)
-
         _create_migrations_folder(migrations_folder_path)
 
         app_config = AppConfig(
@@ -138,42 +256,62 @@ class TestMigrations(DBTestCase):
             table_classes=[],
         )
 
-        for table_class in table_classes:
-            app_config.table_classes = [table_class]
-            meta = run_sync(
-                _create_new_migration(
+        async def create_migrations() -> t.List[str]:
+            migration_paths = []
+            for table_class in table_classes:
+                app_config.table_classes = [table_class]
+                meta = await _create_new_migration(
                     app_config=app_config, auto=True, auto_input="y"
                 )
-            )
-            self.assertTrue(os.path.exists(meta.migration_path))
-            self.run_migrations(app_config=app_config)
-
-            # It's kind of absurd sleeping for 1 microsecond, but it guarantees
-            # the migration IDs will be unique, and just in case computers
-            # and / or Python get insanely fast in the future :)
-            time.sleep(1e-6)
-
-        if test_function:
-            column_name = (
-                table_classes[-1]
-                ._meta.non_default_columns[0]
-                ._meta.db_column_name
-            )
-            row_meta = self.get_postgres_column_definition(
-                tablename="my_table",
-                column_name=column_name,
-            )
-            self.assertTrue(
-                test_function(row_meta),
-                msg=f"Meta is incorrect: {row_meta}",
-            )
+                migration_paths.append(meta.migration_path)
+            return migration_paths
+
+        migration_paths = self.run_in_loop(create_migrations())
+
+        filenames = {i.name for i in os.scandir(migrations_folder_path)}
+        self.assertTrue(
+            all(os.path.basename(i) in filenames for i in migration_paths)
+        )
+
+        # New migrations are generated by comparing the table class with the
+        # previous migration files, rather than the database, so we can run
+        # them all in one go. They're still run in order.
+        self.run_migrations(app_config=app_config)
+
+        if test_function is None:
+            return
+
+        column_name = (
+            table_classes[-1]._meta.non_default_columns[0]._meta.db_column_name
+        )
+        row_meta = self.get_postgres_column_definition(
+            tablename="my_table",
+            column_name=column_name,
+        )
+        self.assertTrue(
+            test_function(row_meta),
+            msg=f"Meta is incorrect: {row_meta}",
+        )
 
     ###########################################################################
 
     def table(self, column: Column):
-        return create_table_class(
+        """
+        Tables with identical columns are used by lots of the tests, so they're
+        cached.
+        """
+        key = _get_cache_key(column)
+        if key is not None:
+            table_class = self.table_cache.get(key)
+            if table_class is not None:
+                return table_class
+
+        table_class = create_table_class(
             class_name="MyTable", class_members={"my_column": column}
         )
+        if key is not None:
+            self.table_cache[key] = table_class
+        return table_class
 
     def test_varchar_column(self):
         self._test_migrations(
@@ -190,12 +328,9 @@ class TestMigrations(DBTestCase):
                     Varchar(index=False),
                 ]
             ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "character varying",
-                    x.is_nullable == "NO",
-                    x.column_default == "''::character varying",
-                ]
+            test_function=check_column(
+                data_type="character varying",
+                column_default="''::character varying",
             ),
         )
 
@@ -213,12 +348,9 @@ class TestMigrations(DBTestCase):
                     Text(index=False),
                 ]
             ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "text",
-                    x.is_nullable == "NO",
-                    x.column_default == "''::text",
-                ]
+            test_function=check_column(
+                data_type="text",
+                column_default="''::text",
             ),
         )
 
@@ -236,12 +368,9 @@ class TestMigrations(DBTestCase):
                     Integer(index=False),
                 ]
             ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "integer",
-                    x.is_nullable == "NO",
-                    x.column_default == "0",
-                ]
+            test_function=check_column(
+                data_type="integer",
+                column_default="0",
             ),
         )
 
@@ -258,12 +387,9 @@ class TestMigrations(DBTestCase):
                     Real(index=False),
                 ]
             ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "real",
-                    x.is_nullable == "NO",
-                    x.column_default == "0.0",
-                ]
+            test_function=check_column(
+                data_type="real",
+                column_default="0.0",
             ),
         )
 
@@ -280,12 +406,9 @@ class TestMigrations(DBTestCase):
                     DoublePrecision(index=False),
                 ]
             ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "double precision",
-                    x.is_nullable == "NO",
-                    x.column_default == "0.0",
-                ]
+            test_function=check_column(
+                data_type="double precision",
+                column_default="0.0",
             ),
         )
 
@@ -303,12 +426,9 @@ class TestMigrations(DBTestCase):
                     SmallInt(index=False),
                 ]
             ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "smallint",
-                    x.is_nullable == "NO",
-                    x.column_default == "0",
-                ]
+            test_function=check_column(
+                data_type="smallint",
+                column_default="0",
             ),
         )
 
@@ -326,12 +446,9 @@ class TestMigrations(DBTestCase):
                     BigInt(index=False),
                 ]
             ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "bigint",
-                    x.is_nullable == "NO",
-                    x.column_default == "0",
-                ]
+            test_function=check_column(
+                data_type="bigint",
+                column_default="0",
             ),
         )
 
@@ -356,12 +473,9 @@ class TestMigrations(DBTestCase):
                     UUID(index=False),
                 ]
             ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "uuid",
-                    x.is_nullable == "NO",
-                    x.column_default == "uuid_generate_v4()",
-                ]
+            test_function=check_column(
+                data_type="uuid",
+                column_default="uuid_generate_v4()",
             ),
         )
 
@@ -382,12 +496,9 @@ class TestMigrations(DBTestCase):
                     Timestamp(index=False),
                 ]
             ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "timestamp without time zone",
-                    x.is_nullable == "NO",
-                    x.column_default in ("now()", "CURRENT_TIMESTAMP"),
-                ]
+            test_function=check_column(
+                data_type="timestamp without time zone",
+                column_default=("now()", "CURRENT_TIMESTAMP"),
             ),
         )
 
@@ -406,13 +517,12 @@ class TestMigrations(DBTestCase):
                     Time(index=False),
                 ]
             ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "time without time zone",
-                    x.is_nullable == "NO",
-                    x.column_default
-                    in ("('now'::text)::time with time zone", "CURRENT_TIME"),
-                ]
+            test_function=check_column(
+                data_type="time without time zone",
+                column_default=(
+                    "('now'::text)::time with time zone",
+                    "CURRENT_TIME",
+                ),
             ),
         )
 
@@ -431,13 +541,9 @@ class TestMigrations(DBTestCase):
                     Date(index=False),
                 ]
             ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "date",
-                    x.is_nullable == "NO",
-                    x.column_default
-                    in ("('now'::text)::date", "CURRENT_DATE"),
-                ]
+            test_function=check_column(
+                data_type="date",
+                column_default=("('now'::text)::date", "CURRENT_DATE"),
             ),
         )
 
@@ -455,12 +561,9 @@ class TestMigrations(DBTestCase):
                     Interval(index=False),
                 ]
             ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "interval",
-                    x.is_nullable == "NO",
-                    x.column_default == "'00:00:00'::interval",
-                ]
+            test_function=check_column(
+                data_type="interval",
+                column_default="'00:00:00'::interval",
             ),
         )
 
@@ -478,12 +581,9 @@ class TestMigrations(DBTestCase):
                     Boolean(index=False),
                 ]
             ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "boolean",
-                    x.is_nullable == "NO",
-                    x.column_default == "false",
-                ]
+            test_function=check_column(
+                data_type="boolean",
+                column_default="false",
             ),
         )
 
@@ -503,12 +603,9 @@ class TestMigrations(DBTestCase):
                     Array(base_column=Integer(), index=False),
                 ]
             ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "ARRAY",
-                    x.is_nullable == "NO",
-                    x.column_default == "'{}'::integer[]",
-                ]
+            test_function=check_column(
+                data_type="ARRAY",
+                column_default="'{}'::integer[]",
             ),
         )
 
@@ -528,12 +625,9 @@ class TestMigrations(DBTestCase):
                     Array(base_column=Varchar(), index=False),
                 ]
             ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "ARRAY",
-                    x.is_nullable == "NO",
-                    x.column_default == "'{}'::character varying[]",
-                ]
+            test_function=check_column(
+                data_type="ARRAY",
+                column_default="'{}'::character varying[]",
             ),
         )
 
@@ -555,12 +649,9 @@ class TestMigrations(DBTestCase):
                     JSON(null=False),
                 ]
             ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "json",
-                    x.is_nullable == "NO",
-                    x.column_default == "'{}'::json",
-                ]
+            test_function=check_column(
+                data_type="json",
+                column_default="'{}'::json",
             ),
         )
 
@@ -577,12 +668,9 @@ class TestMigrations(DBTestCase):
                     JSONB(null=False),
                 ]
             ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "jsonb",
-                    x.is_nullable == "NO",
-                    x.column_default == "'{}'::jsonb",
-                ]
+            test_function=check_column(
+                data_type="jsonb",
+                column_default="'{}'::jsonb",
             ),
         )
 
@@ -599,12 +687,9 @@ class TestMigrations(DBTestCase):
                     Varchar(db_column_name="custom_name_2"),
                 ]
             ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "character varying",
-                    x.is_nullable == "NO",
-                    x.column_default == "''::character varying",
-                ]
+            test_function=check_column(
+                data_type="character varying",
+                column_default="''::character varying",
             ),
         )
 
@@ -620,12 +705,9 @@ class TestMigrations(DBTestCase):
                     Varchar(db_column_name="custom_name"),
                 ]
             ],
-            test_function=lambda x: all(
-                [
-                    x.data_type == "character varying",
-                    x.is_nullable == "NO",
-                    x.column_default == "''::character varying",
-                ]
+            test_function=check_column(
+                data_type="character varying",
+                column_default="''::character varying",
             ),
         )
 
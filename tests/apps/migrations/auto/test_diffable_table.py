@@ -90,3 +90,15 @@ class TestDiffableTable(TestCase):
 
         self.assertEqual(delta.alter_columns[0].params, {"unique": True})
         self.assertEqual(delta.alter_columns[0].old_params, {"unique": False})
+
+    def test_hash(self):
+        """
+        Tables should only be considered the same if both the class name and
+        tablename match.
+        """
+        tables = {
+            DiffableTable(class_name="Band", tablename="band"),
+            DiffableTable(class_name="Band", tablename="band"),
+            DiffableTable(class_name="Ban", tablename="dband"),
+        }
+        self.assertEqual(len(tables), 2)
@@ -4,7 +4,19 @@ import typing as t
 from unittest import TestCase
 
 from piccolo.apps.migrations.auto import DiffableTable, SchemaDiffer
-from piccolo.columns.column_types import Numeric, Varchar
+from piccolo.apps.migrations.auto.schema_differ import is_schema_unchanged
+from piccolo.apps.migrations.auto.schema_snapshot import SchemaSnapshot
+from piccolo.apps.migrations.commands.base import BaseMigrationManager
+from piccolo.columns.column_types import (
+    ForeignKey,
+    Numeric,
+    Timestamp,
+    Varchar,
+)
+from piccolo.columns.defaults.timestamp import TimestampNow
+from piccolo.table import Table
+from piccolo.utils.sync import run_sync
+from tests.example_apps.music.piccolo_app import APP_CONFIG
 
 
 class TestSchemaDiffer(TestCase):
@@ -90,6 +102,105 @@ class TestSchemaDiffer(TestCase):
         self.assertEqual(schema_differ.create_tables.statements, [])
         self.assertEqual(schema_differ.drop_tables.statements, [])
 
+    def test_rename_tablename(self):
+        """
+        Changing the tablename, but not the class name, should be detected as
+        a rename without asking the user.
+        """
+        name_column = Varchar()
+        name_column._meta.name = "name"
+
+        schema: t.List[DiffableTable] = [
+            DiffableTable(
+                class_name="Band", tablename="band_2", columns=[name_column]
+            )
+        ]
+        schema_snapshot: t.List[DiffableTable] = [
+            DiffableTable(
+                class_name="Band", tablename="band", columns=[name_column]
+            )
+        ]
+
+        schema_differ = SchemaDiffer(
+            schema=schema, schema_snapshot=schema_snapshot, auto_input="n"
+        )
+
+        self.assertEqual(
+            schema_differ.rename_tables.statements,
+            [
+                "manager.rename_table(old_class_name='Band', old_tablename='band', new_class_name='Band', new_tablename='band_2')"  # noqa: E501
+            ],
+        )
+        self.assertEqual(schema_differ.create_tables.statements, [])
+        self.assertEqual(schema_differ.drop_tables.statements, [])
+
+        # It should still be detected as a rename if none of the column names
+        # are the same.
+        title_column = Varchar()
+        title_column._meta.name = "title"
+
+        schema = [
+            DiffableTable(
+                class_name="Band", tablename="band_2", columns=[title_column]
+            )
+        ]
+
+        schema_differ = SchemaDiffer(
+            schema=schema, schema_snapshot=schema_snapshot, auto_input="y"
+        )
+
+        self.assertEqual(
+            schema_differ.rename_tables.statements,
+            [
+                "manager.rename_table(old_class_name='Band', old_tablename='band', new_class_name='Band', new_tablename='band_2')"  # noqa: E501
+            ],
+        )
+        self.assertEqual(schema_differ.create_tables.statements, [])
+        self.assertEqual(schema_differ.drop_tables.statements, [])
+        self.assertEqual(schema_differ.add_columns.statements, [])
+        self.assertEqual(
+            schema_differ.rename_columns.statements,
+            [
+                "manager.rename_column(table_class_name='Band', tablename='band', old_column_name='name', new_column_name='title', old_db_column_name='name', new_db_column_name='title')"  # noqa: E501
+            ],
+        )
+
+    def test_rename_table_no_shared_columns(self):
+        """
+        If the new table doesn't share any column names with the dropped
+        table, it shouldn't be considered a rename.
+        """
+        name_column = Varchar()
+        name_column._meta.name = "name"
+
+        title_column = Varchar()
+        title_column._meta.name = "title"
+
+        schema: t.List[DiffableTable] = [
+            DiffableTable(
+                class_name="Act", tablename="act", columns=[title_column]
+            )
+        ]
+        schema_snapshot: t.List[DiffableTable] = [
+            DiffableTable(
+                class_name="Band", tablename="band", columns=[name_column]
+            )
+        ]
+
+        schema_differ = SchemaDiffer(
+            schema=schema, schema_snapshot=schema_snapshot, auto_input="y"
+        )
+
+        self.assertEqual(schema_differ.rename_tables.statements, [])
+        self.assertEqual(
+            schema_differ.create_tables.statements,
+            ["manager.add_table('Act', tablename='act')"],
+        )
+        self.assertEqual(
+            schema_differ.drop_tables.statements,
+            ["manager.drop_table(class_name='Band', tablename='band')"],
+        )
+
     def test_add_column(self):
         """
         Test adding a column to an existing table.
@@ -229,3 +340,126 @@ class TestSchemaDiffer(TestCase):
 
     def test_alter_default(self):
         pass
+
+    def test_no_changes(self):
+        """
+        If the schema matches the snapshot, there should be no statements.
+        """
+
+        def get_schema() -> t.List[DiffableTable]:
+            name_column = Varchar(length=100)
+            name_column._meta.name = "name"
+
+            price_column = Numeric(digits=(5, 2))
+            price_column._meta.name = "price"
+
+            created_on_column = Timestamp(default=TimestampNow())
+            created_on_column._meta.name = "created_on"
+
+            return [
+                DiffableTable(
+                    class_name="Ticket",
+                    tablename="ticket",
+                    columns=[name_column, price_column, created_on_column],
+                )
+            ]
+
+        schema = get_schema()
+        schema_snapshot = get_schema()
+
+        schema_differ = SchemaDiffer(
+            schema=schema, schema_snapshot=schema_snapshot
+        )
+        self.assertTrue(schema_differ._unchanged)
+        for alter_statements in schema_differ.get_alter_statements():
+            self.assertEqual(alter_statements.statements, [])
+
+
+class TestIsSchemaUnchanged(TestCase):
+    def get_schema(self) -> t.List[DiffableTable]:
+        return [
+            DiffableTable(
+                class_name=i.__name__,
+                tablename=i._meta.tablename,
+                columns=i._meta.non_default_columns,
+            )
+            for i in APP_CONFIG.table_classes
+        ]
+
+    def get_schema_snapshot(self) -> t.List[DiffableTable]:
+        migration_managers = run_sync(
+            BaseMigrationManager().get_migration_managers(
+                app_config=APP_CONFIG
+            )
+        )
+        return SchemaSnapshot(managers=migration_managers).get_snapshot()
+
+    def test_migration_files(self):
+        """
+        Make sure a snapshot built from real migration files is recognised as
+        unchanged - they contain foreign keys, and legacy params which aren't
+        in the schema.
+        """
+        schema = self.get_schema()
+        schema_snapshot = self.get_schema_snapshot()
+
+        self.assertTrue(
+            is_schema_unchanged(schema=schema, schema_snapshot=schema_snapshot)
+        )
+
+        schema_differ = SchemaDiffer(
+            schema=schema, schema_snapshot=schema_snapshot
+        )
+        self.assertTrue(schema_differ._unchanged)
+        for alter_statements in schema_differ.get_alter_statements():
+            self.assertEqual(alter_statements.statements, [])
+
+    def test_changed_param(self):
+        schema = self.get_schema()
+
+        name_column = Varchar(length=300)
+        name_column._meta.name = "name"
+        schema[0] = DiffableTable(
+            class_name="Manager", tablename="manager", columns=[name_column]
+        )
+
+        self.assertFalse(
+            is_schema_unchanged(
+                schema=schema, schema_snapshot=self.get_schema_snapshot()
+            )
+        )
+
+    def test_foreign_key(self):
+        """
+        Foreign keys are compared using their serialised values.
+        """
+
+        class Manager(Table):
+            pass
+
+        class Director(Table):
+            pass
+
+        def get_schema(references: t.Type[Table]) -> t.List[DiffableTable]:
+            manager_column = ForeignKey(references=references)
+            manager_column._meta.name = "manager"
+            return [
+                DiffableTable(
+                    class_name="Band",
+                    tablename="band",
+                    columns=[manager_column],
+                )
+            ]
+
+        self.assertTrue(
+            is_schema_unchanged(
+                schema=get_schema(Manager),
+                schema_snapshot=get_schema(Manager),
+            )
+        )
+        self.assertFalse(
+            is_schema_unchanged(
+                schema=get_schema(Manager),
+                schema_snapshot=get_schema(Director),
+            )
+        )
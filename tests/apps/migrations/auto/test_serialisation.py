@@ -1,7 +1,10 @@
 from enum import Enum
 from unittest import TestCase
 
-from piccolo.apps.migrations.auto.serialisation import serialise_params
+from piccolo.apps.migrations.auto.serialisation import (
+    Import,
+    serialise_params,
+)
 from piccolo.columns.base import OnDelete
 from piccolo.columns.choices import Choice
 from piccolo.columns.column_types import Varchar
@@ -13,6 +16,35 @@ def example_function():
     pass
 
 
+class TestImport(TestCase):
+    def test_sorting(self):
+        """
+        Imports should be sorted the same as their import statements.
+        """
+        imports = [
+            Import(module="piccolo.columns.column_types", target="Varchar"),
+            Import(module="piccolo.columns", target="Varchar"),
+            Import(module="decimal", target="Decimal"),
+            Import(module="piccolo.columns.column_types", target="Integer"),
+        ]
+        self.assertEqual(
+            [repr(i) for i in sorted(imports)],
+            sorted(repr(i) for i in imports),
+        )
+
+    def test_hash(self):
+        self.assertEqual(
+            len(
+                {
+                    Import(module="decimal", target="Decimal"),
+                    Import(module="decimal", target="Decimal"),
+                    Import(module="uuid", target="UUID"),
+                }
+            ),
+            2,
+        )
+
+
 class TestSerialiseParams(TestCase):
     def test_time(self):
         serialised = serialise_params(params={"default": TimeNow()})
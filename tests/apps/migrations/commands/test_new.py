@@ -1,5 +1,4 @@
-import os
-import shutil
+import datetime
 import tempfile
 from unittest import TestCase
 from unittest.mock import MagicMock, call, patch
@@ -7,6 +6,7 @@ from unittest.mock import MagicMock, call, patch
 from piccolo.apps.migrations.commands.new import (
     BaseMigrationManager,
     _create_new_migration,
+    _generate_migration_meta,
     new,
 )
 from piccolo.conf.apps import AppConfig
@@ -20,25 +20,18 @@ class TestNewMigrationCommand(TestCase):
         """
         Create a manual migration (i.e. non-auto).
         """
-        migration_folder = os.path.join(
-            tempfile.gettempdir(), "piccolo_migrations"
-        )
-        if os.path.exists(migration_folder):
-            shutil.rmtree(migration_folder)
-
-        os.mkdir(migration_folder)
+        with tempfile.TemporaryDirectory() as migration_folder:
+            app_config = AppConfig(
+                app_name="music",
+                migrations_folder_path=migration_folder,
+                table_classes=[Manager],
+            )
 
-        app_config = AppConfig(
-            app_name="music",
-            migrations_folder_path=migration_folder,
-            table_classes=[Manager],
-        )
+            run_sync(_create_new_migration(app_config, auto=False))
 
-        run_sync(_create_new_migration(app_config, auto=False))
-
-        migration_modules = BaseMigrationManager().get_migration_modules(
-            migration_folder
-        )
+            migration_modules = BaseMigrationManager().get_migration_modules(
+                migration_folder
+            )
 
         self.assertTrue(len(migration_modules.keys()) == 1)
 
@@ -56,3 +49,29 @@ class TestNewMigrationCommand(TestCase):
         self.assertTrue(
             print_.mock_calls[-1] == call("No changes detected - exiting.")
         )
+
+
+class TestGenerateMigrationMeta(TestCase):
+    @patch("piccolo.apps.migrations.commands.new.datetime")
+    def test_unique_ids(self, datetime_: MagicMock):
+        """
+        Make sure the migration IDs are unique and increasing, even if the
+        clock hasn't moved on.
+        """
+        datetime_.datetime.now.return_value = datetime.datetime(
+            year=2021, month=1, day=1
+        )
+        datetime_.timedelta = datetime.timedelta
+
+        app_config = AppConfig(
+            app_name="music",
+            migrations_folder_path=tempfile.gettempdir(),
+            table_classes=[],
+        )
+        ids = [
+            _generate_migration_meta(app_config=app_config).migration_id
+            for _ in range(3)
+        ]
+
+        self.assertEqual(len(set(ids)), 3)
+        self.assertEqual(ids, sorted(ids))
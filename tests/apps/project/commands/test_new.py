@@ -7,13 +7,9 @@ from piccolo.apps.project.commands.new import new
 
 class TestNewProject(TestCase):
     def test_new(self):
-        root = tempfile.gettempdir()
+        with tempfile.TemporaryDirectory() as root:
+            new(root=root)
 
-        file_path = os.path.join(root, "piccolo_conf.py")
-
-        if os.path.exists(file_path):
-            os.unlink(file_path)
-
-        new(root=root)
-
-        self.assertTrue(os.path.exists(file_path))
+            self.assertTrue(
+                os.path.exists(os.path.join(root, "piccolo_conf.py"))
+            )
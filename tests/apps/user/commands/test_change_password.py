@@ -34,3 +34,19 @@ class TestChangePassword(TestCase):
             BaseUser.login_sync(username="bob123", password="new_password")
             is not None
         )
+
+    @patch(
+        "piccolo.apps.user.commands.change_password.get_username",
+        return_value="bob123",
+    )
+    @patch("piccolo.apps.user.commands.change_password.get_password")
+    def test_missing_user(self, get_password, *args, **kwargs):
+        """
+        If the user doesn't exist, we should exit without asking for the new
+        password.
+        """
+        with self.assertRaises(SystemExit) as manager:
+            change_password()
+
+        self.assertEqual(manager.exception.code, "User bob123 doesn't exist!")
+        get_password.assert_not_called()
@@ -67,7 +67,7 @@ class DBTestCase(TestCase):
         query = """
             SELECT {columns} FROM information_schema.columns
             WHERE table_name = '{tablename}'
-            AND table_catalog = 'piccolo'
+            AND table_catalog = current_database()
             AND column_name = '{column_name}'
         """.format(
             columns=RowMeta.get_column_name_str(),
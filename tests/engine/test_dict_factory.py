@@ -0,0 +1,24 @@
+import sqlite3
+from unittest import TestCase
+
+from piccolo.engine.sqlite import dict_factory
+
+
+class TestDictFactory(TestCase):
+    def test_dict_factory(self):
+        """
+        Make sure the column names are correct, even when switching between
+        queries.
+        """
+        connection = sqlite3.connect(":memory:")
+        connection.row_factory = dict_factory
+
+        self.assertEqual(
+            connection.execute("SELECT 1 AS a, 2 AS b").fetchall(),
+            [{"a": 1, "b": 2}],
+        )
+        self.assertEqual(
+            connection.execute("SELECT 3 AS c").fetchall(),
+            [{"c": 3}],
+        )
+        connection.close()
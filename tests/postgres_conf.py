@@ -1,17 +1,51 @@
 import os
 
+import asyncpg  # type: ignore
+
 from piccolo.conf.apps import AppRegistry
 from piccolo.engine.postgres import PostgresEngine
+from piccolo.utils.sync import run_sync
 
-DB = PostgresEngine(
-    config={
-        "host": os.environ.get("PG_HOST", "localhost"),
-        "port": os.environ.get("PG_PORT", "5432"),
-        "user": os.environ.get("PG_USER", "postgres"),
-        "password": os.environ.get("PG_PASSWORD", ""),
-        "database": os.environ.get("PG_DATABASE", "piccolo"),
-    }
-)
+CONFIG = {
+    "host": os.environ.get("PG_HOST", "localhost"),
+    "port": os.environ.get("PG_PORT", "5432"),
+    "user": os.environ.get("PG_USER", "postgres"),
+    "password": os.environ.get("PG_PASSWORD", ""),
+    "database": os.environ.get("PG_DATABASE", "piccolo"),
+}
+
+# When running the tests in parallel using pytest-xdist (e.g. ``-n auto``),
+# each worker gets its own database, so the tests don't interfere with each
+# other.
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+
+
+async def create_worker_database(database: str):
+    """
+    Creates the database if it doesn't already exist. It's cloned from
+    ``template0``, which nothing can connect to, as cloning fails if the
+    template database is in use.
+    """
+    connection = await asyncpg.connect(**{**CONFIG, "database": "postgres"})
+    try:
+        exists = await connection.fetchval(
+            "SELECT EXISTS(SELECT 1 FROM pg_database WHERE datname = $1)",
+            database,
+        )
+        if not exists:
+            await connection.execute(
+                f'CREATE DATABASE "{database}" TEMPLATE template0'
+            )
+    finally:
+        await connection.close()
+
+
+if XDIST_WORKER:
+    CONFIG["database"] = f"{CONFIG['database']}_{XDIST_WORKER}"
+    run_sync(create_worker_database(CONFIG["database"]))
+
+
+DB = PostgresEngine(config=CONFIG)
 
 
 APP_REGISTRY = AppRegistry(
@@ -0,0 +1,142 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from piccolo.query import Insert, Select
+from piccolo.query.base import Query, _translate_keys
+from piccolo.utils.sync import run_sync
+from tests.base import DBTestCase
+from tests.example_apps.music.tables import Band
+
+
+class Record:
+    """
+    Mimics an asyncpg ``Record``, where ``keys`` and ``values`` return
+    iterators rather than lists.
+    """
+
+    def __init__(self, **kwargs):
+        self._data = kwargs
+
+    def keys(self):
+        return iter(self._data.keys())
+
+    def values(self):
+        return iter(self._data.values())
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+
+class TestProcessResults(DBTestCase):
+    def test_executor(self):
+        """
+        Large result sets are converted in a thread - make sure the response
+        is the same.
+        """
+        self.insert_rows()
+
+        query = Band.select(Band.name, Band.manager.name).order_by(Band.name)
+        expected = query.run_sync()
+
+        with patch("piccolo.query.base.EXECUTOR_ROW_THRESHOLD", 1):
+            response = query.run_sync()
+
+        self.assertEqual(response, expected)
+        self.assertEqual(len(response), 3)
+
+    def test_as_list(self):
+        self.insert_rows()
+
+        response = (
+            Band.select(Band.manager.name)
+            .order_by(Band.manager.name)
+            .output(as_list=True)
+            .run_sync()
+        )
+        self.assertEqual(response, ["Graydon", "Guido", "Mads"])
+
+        response = (
+            Band.select(Band.name)
+            .order_by(Band.name)
+            .output(as_list=True, as_json=True)
+            .run_sync()
+        )
+        self.assertEqual(
+            response.replace(" ", ""),
+            '["CSharps","Pythonistas","Rustaceans"]',
+        )
+
+    def test_as_list_multiple_columns(self):
+        self.insert_row()
+
+        with self.assertRaises(ValueError):
+            Band.select(Band.name, Band.popularity).output(
+                as_list=True
+            ).run_sync()
+
+
+class TestProcessRecords(TestCase):
+    """
+    Make sure rows which aren't dicts (e.g. from asyncpg) are handled.
+    """
+
+    def test_as_list(self):
+        response = run_sync(
+            Band.select(Band.name)
+            .output(as_list=True)
+            ._process_results([Record(name="a"), Record(name="b")])
+        )
+        self.assertEqual(response, ["a", "b"])
+
+    def test_as_list_multiple_columns(self):
+        with self.assertRaises(ValueError):
+            run_sync(
+                Band.select(Band.name, Band.popularity)
+                .output(as_list=True)
+                ._process_results([Record(name="a", popularity=1)])
+            )
+
+    def test_dicts(self):
+        response = run_sync(
+            Band.select(Band.name, Band.manager.name)._process_results(
+                [Record(name="a", **{"manager$name": "b"})]
+            )
+        )
+        self.assertEqual(response, [{"name": "a", "manager.name": "b"}])
+
+
+class TestRowsNeedConverting(TestCase):
+    def test_rows_need_converting(self):
+        self.assertFalse(Query._rows_need_converting([{"name": "a"}]))
+        self.assertTrue(Query._rows_need_converting([{"manager$name": "a"}]))
+        self.assertTrue(Query._rows_need_converting([Record(name="a")]))
+
+    def test_executor_skipped(self):
+        """
+        If the rows don't need converting, a thread shouldn't be used, even
+        for large result sets.
+        """
+        with patch("piccolo.query.base.EXECUTOR_ROW_THRESHOLD", 1), patch(
+            "piccolo.query.base.asyncio"
+        ) as asyncio_:
+            response = run_sync(
+                Band.select(Band.name)._process_results([{"name": "a"}])
+            )
+
+        self.assertEqual(response, [{"name": "a"}])
+        asyncio_.get_running_loop.assert_not_called()
+
+
+class TestTranslateKeys(TestCase):
+    def test_translate_keys(self):
+        self.assertEqual(
+            _translate_keys(("name", "manager$name")),
+            ("name", "manager.name"),
+        )
+        self.assertIsNone(_translate_keys(("name", "popularity")))
+
+
+class TestHasRunCallback(TestCase):
+    def test_has_run_callback(self):
+        self.assertTrue(Insert._has_run_callback)
+        self.assertFalse(Select._has_run_callback)
@@ -109,3 +109,13 @@ class TestFreeze(DBTestCase):
 
         with self.assertRaises(AttributeError):
             query.where(Band.name == "Pythonistas")
+
+    def test_querystrings_compiled(self):
+        """
+        The frozen query should reuse the querystrings which were compiled
+        when freezing, rather than generating new ones.
+        """
+        query = Band.select().where(Band.name == "Pythonistas").freeze()
+
+        for querystring in query.query.querystrings:
+            self.assertIsNotNone(querystring._frozen_compiled_strings)
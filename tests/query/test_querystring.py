@@ -28,3 +28,28 @@ class TestQueryString(TestCase):
     def test_querystring_with_no_args(self):
         qs = QueryString("SELECT name FROM band")
         self.assertEqual(qs.compile_string(), ("SELECT name FROM band", []))
+
+    def test_reused_template(self):
+        """
+        The parsed templates are cached - make sure querystrings sharing a
+        template don't affect each other.
+        """
+        qs_1 = QueryString("WHERE name = {} AND popularity > {}", "a", 1)
+        qs_2 = QueryString(
+            "WHERE name = {} AND popularity > {}",
+            "b",
+            QueryString("{} + {}", 2, 3),
+        )
+
+        self.assertEqual(
+            qs_2.compile_string(),
+            ("WHERE name = $1 AND popularity > $2 + $3", ["b", 2, 3]),
+        )
+        self.assertEqual(
+            qs_1.compile_string(engine_type="sqlite"),
+            ("WHERE name = ? AND popularity > ?", ["a", 1]),
+        )
+        self.assertEqual(
+            qs_1.compile_string(),
+            ("WHERE name = $1 AND popularity > $2", ["a", 1]),
+        )
@@ -1,7 +1,15 @@
+import os
+
 from piccolo.conf.apps import AppRegistry
 from piccolo.engine.sqlite import SQLiteEngine
 
-DB = SQLiteEngine(path="test.sqlite")
+# When running the tests in parallel using pytest-xdist (e.g. ``-n auto``),
+# each worker gets its own database file.
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+
+DB = SQLiteEngine(
+    path=f"test_{XDIST_WORKER}.sqlite" if XDIST_WORKER else "test.sqlite"
+)
 
 
 APP_REGISTRY = AppRegistry(
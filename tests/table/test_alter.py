@@ -209,7 +209,7 @@ class TestSetNull(DBTestCase):
         query = """
             SELECT is_nullable FROM information_schema.columns
             WHERE table_name = 'band'
-            AND table_catalog = 'piccolo'
+            AND table_catalog = current_database()
             AND column_name = 'popularity'
             """
 
@@ -228,7 +228,7 @@ class TestSetLength(DBTestCase):
         query = """
             SELECT character_maximum_length FROM information_schema.columns
             WHERE table_name = 'band'
-            AND table_catalog = 'piccolo'
+            AND table_catalog = current_database()
             AND column_name = 'name'
             """
 
@@ -272,7 +272,7 @@ class TestSetDigits(TestCase):
             SELECT numeric_precision, numeric_scale
             FROM information_schema.columns
             WHERE table_name = 'ticket'
-            AND table_catalog = 'piccolo'
+            AND table_catalog = current_database()
             AND column_name = 'price'
             """
 
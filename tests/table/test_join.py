@@ -364,3 +364,21 @@ class TestJoin(TestCase):
 
         self.assertIsInstance(ticket.concert.band_2.manager.id, int)
         self.assertIsInstance(ticket.concert.band_2.manager.name, str)
+
+
+class TestGetJoins(TestCase):
+    def test_get_joins(self):
+        """
+        Make sure the table aliases are correct for deep joins, and that
+        duplicate joins are removed.
+        """
+        joins = Concert.select()._get_joins(
+            [Concert.band_1.manager.name, Concert.band_1.name]
+        )
+        self.assertEqual(
+            joins,
+            [
+                "LEFT JOIN band concert$band_1 ON (concert.band_1 = concert$band_1.id)",  # noqa: E501
+                "LEFT JOIN manager concert$band_1$band$manager ON (concert$band_1.manager = concert$band_1$band$manager.id)",  # noqa: E501
+            ],
+        )
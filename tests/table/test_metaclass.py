@@ -1,7 +1,9 @@
 from unittest import TestCase
+from unittest.mock import MagicMock
 
 from piccolo.columns import Secret
 from piccolo.columns.column_types import JSON, JSONB, ForeignKey
+from piccolo.engine.sqlite import SQLiteEngine
 from piccolo.table import Table
 from tests.example_apps.music.tables import Band
 
@@ -85,3 +87,18 @@ class TestMetaClass(TestCase):
             pass
 
         self.assertTrue(hasattr(TableA, "id"))
+
+    def test_engine_type(self):
+        """
+        The engine type is cached, so make sure it's updated if the engine
+        changes.
+        """
+
+        class Musician(Table):
+            pass
+
+        Musician._meta.db = SQLiteEngine()
+        self.assertEqual(Musician._meta.engine_type, "sqlite")
+
+        Musician._meta.db = MagicMock(engine_type="postgres")
+        self.assertEqual(Musician._meta.engine_type, "postgres")
@@ -218,3 +218,40 @@ class TestObjects(DBTestCase):
             .run_sync()
         )
         self.assertIsInstance(band.manager, Manager)
+
+    def test_from_rows(self):
+        """
+        Make sure instances created from rows are the same as those created
+        using the constructor.
+        """
+        self.insert_rows()
+
+        rows = Band.select().order_by(Band.name).run_sync()
+        instances = Band._from_rows(rows)
+        expected = [Band(**row, exists_in_db=True) for row in rows]
+
+        self.assertEqual(
+            [i.to_dict() for i in instances],
+            [i.to_dict() for i in expected],
+        )
+        self.assertTrue(all(i._exists_in_db for i in instances))
+        self.assertEqual(Band._from_rows([]), [])
+
+    def test_from_rows_custom_setitem(self):
+        """
+        If a subclass overrides ``__setitem__``, it should still be called.
+        """
+        self.insert_row()
+
+        set_keys = []
+
+        class CustomBand(Band, tablename="band"):
+            def __setitem__(self, key, value):
+                set_keys.append(key)
+                super().__setitem__(key, value)
+
+        rows = CustomBand.select().run_sync()
+        instances = CustomBand._from_rows(rows)
+
+        self.assertEqual(instances[0].name, "Pythonistas")
+        self.assertIn("name", set_keys)
@@ -1,5 +1,9 @@
+import importlib.util
+import sys
 from unittest import TestCase
+from unittest.mock import patch
 
+from piccolo.utils import encoding
 from piccolo.utils.encoding import dump_json, load_json
 
 
@@ -10,3 +14,30 @@ class TestEncodingDecoding(TestCase):
         """
         payload = {"a": [1, 2, 3]}
         self.assertEqual(load_json(dump_json(payload)), payload)
+
+    def test_json_fallback(self):
+        """
+        If orjson isn't installed, the json module should be used instead.
+
+        A separate copy of the module is loaded, so the one used by the rest
+        of Piccolo isn't modified.
+        """
+        spec = importlib.util.spec_from_file_location(
+            "_encoding_without_orjson", encoding.__file__
+        )
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+
+        with patch.dict(sys.modules, {"orjson": None}):
+            spec.loader.exec_module(module)
+
+        self.assertFalse(module.ORJSON)
+        self.assertNotIn("_encoding_without_orjson", sys.modules)
+        self.assertIs(encoding.dump_json, dump_json)
+
+        payload = {"a": [1, 2, 3]}
+        self.assertEqual(module.load_json(module.dump_json(payload)), payload)
+        self.assertEqual(
+            module.dump_json(payload, pretty=True),
+            '{\n  "a": [\n    1,\n    2,\n    3\n  ]\n}',
+        )